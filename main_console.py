@@ -4,6 +4,17 @@ import os
 from eod_cleaner.cleaner import EODCleaner
 
 
+def positive_float(value):
+    """Argparse type for throttle limits, which must be greater than zero."""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number: {value}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than zero: {value}")
+    return number
+
+
 def main():
     # Set up argument parser
     parser = argparse.ArgumentParser(description="EOD Cleanup Tool")
@@ -14,27 +25,91 @@ def main():
         default="",
         help="Path to the archive folder (default: None)",
     )
+    parser.add_argument(
+        "--root",
+        action="append",
+        default=[],
+        dest="extra_roots",
+        help="Additional root folder to scan together with root_folder (repeatable)",
+    )
     parser.add_argument("--scan", action="store_true", help="Run dry scan")
     parser.add_argument("--move", action="store_true", help="Move unused EODs")
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help="Pack small unused EODs into indexed tar bundles when moving",
+    )
+    parser.add_argument(
+        "--max-mbps",
+        type=positive_float,
+        help="Limit move bandwidth to this many MiB (1024 * 1024 bytes) per second",
+    )
+    parser.add_argument(
+        "--max-ops",
+        type=positive_float,
+        help="Limit moves to this many file operations per second",
+    )
+    parser.add_argument(
+        "--throttle-window",
+        action="append",
+        default=[],
+        metavar="HH:MM-HH:MM",
+        help="Apply the limits only during this time of day (repeatable); "
+        "moves run at full speed outside all windows",
+    )
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help="Write the top directories by reclaimable space to JSON",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of directories in the space report (default: 20)",
+    )
 
     args = parser.parse_args()
 
-    # Validate root folder
-    if not os.path.isdir(args.root_folder):
-        logging.error(f"Root folder does not exist: {args.root_folder}")
-        return
+    # Validate root folders
+    root_folders = [args.root_folder] + args.extra_roots
+    for root_folder in root_folders:
+        if not os.path.isdir(root_folder):
+            logging.error(f"Root folder does not exist: {root_folder}")
+            return
 
     cleaner = EODCleaner()
 
     if args.scan:
-        cleaner.set_folders(args.root_folder, "")  # Use empty string instead of None
+        cleaner.set_folders(root_folders, "")  # Use empty string instead of None
         logging.info("Running dry scan...")
         runspec_files = cleaner.find_runspec_files()
         cleaner.extract_runspec_metadata(runspec_files)
-        unused_eods = cleaner.list_unused_eods()
-        cleaner.save_metadata(unused_eods)
+        cleaner.list_unused_eods()
+        cleaner.save_metadata(cleaner.eod_dict)
+        for root, result in cleaner.root_results.items():
+            logging.info(
+                f"{root}: {result['file_count']} EOD files, "
+                f"{result['files_per_second']:.1f} files/s"
+            )
         logging.info("Scan completed and metadata saved.")
 
+    if args.report:
+        cleaner.set_folders(root_folders, args.archive_folder or "")
+        # Reuse the in-memory scan, or the saved scan table from a previous run
+        df = None if cleaner.eod_dict else cleaner.load_metadata()
+        if df is None and not cleaner.eod_dict:
+            logging.error("No metadata found. Run dry scan first.")
+            return
+        report = cleaner.build_space_report(df, top_n=args.top)
+        for entry in report:
+            logging.info(
+                f"{entry['directory']}: {entry['reclaimable_bytes']} bytes reclaimable "
+                f"({entry['unused_count']} unused, {entry['used_count']} used, "
+                f"{entry['missing_count']} missing)"
+            )
+        cleaner.save_space_report(report)
+
     if args.move:
         if not args.archive_folder:
             logging.error("Archive folder must be specified for --move operation.")
@@ -43,9 +118,19 @@ def main():
             logging.error(f"Archive folder does not exist: {args.archive_folder}")
             return
 
-        cleaner.set_folders(args.root_folder, args.archive_folder)
+        cleaner.set_folders(root_folders, args.archive_folder)
+        try:
+            windows = [window.split("-") for window in args.throttle_window]
+            cleaner.set_throttle(
+                args.max_mbps * 1024 * 1024 if args.max_mbps is not None else None,
+                args.max_ops,
+                windows,
+            )
+        except ValueError as e:
+            logging.error(f"Invalid throttle settings: {e}")
+            return
         logging.info("Moving unused EODs...")
-        cleaner.move_eods()
+        cleaner.move_eods(bundle=args.bundle)
         logging.info("Unused EODs moved.")
 
 
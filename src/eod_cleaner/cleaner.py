@@ -1,20 +1,56 @@
+import hashlib
+import os
 import shutil
 import json
 import logging
 import pandas as pd
 import platform
 import re
+import tarfile
+import threading
+import time
+import uuid
 from pathlib import Path
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from eod_cleaner.throttle import IOThrottle
+
+
+class _HashingReader:
+    """File wrapper that hashes data as it is read."""
+
+    def __init__(self, file):
+        self.file = file
+        self.digest = hashlib.sha256()
+
+    def read(self, size=-1):
+        data = self.file.read(size)
+        self.digest.update(data)
+        return data
 
 
 class EODCleaner:
     def __init__(self, log_file="eod_cleanup.log", metadata_file=None):
         self.root_folder = None
+        self.root_folders = []
         self.archive_folder = None
         self.runspec_data = {}
         self.eod_dict = {}
+        # Per-root scan rows and throughput, keyed by root folder
+        self.root_results = {}
+        # Paths known not to exist, mapped to the monotonic time they expire
+        self.negative_cache = {}
+        self.negative_cache_ttl = 300
+        # Optional IOThrottle shared by all mover threads
+        self.throttle = None
+        # SHA-256 and archive path of each EOD copied or bundled, by source path
+        self.checksums = {}
+        self.checksums_lock = threading.Lock()
+        # Re-read copied files to compare hashes, at the cost of a second read
+        self.verify_readback = False
+        # Bundle index entries by source path, and the index files already loaded
+        self.bundle_lookup = {}
+        self.loaded_indexes = set()
         self.metadata_file = (
             Path(metadata_file)
             if metadata_file
@@ -28,9 +64,31 @@ class EODCleaner:
         )
 
     def set_folders(self, root_folder, archive_folder):
-        """Set root and archive folders (supports network drives)."""
-        self.root_folder = self._resolve_path(root_folder)
+        """Set root and archive folders (supports network drives).
+
+        `root_folder` may be a single folder or a list of folders to scan together.
+        """
+        if isinstance(root_folder, (list, tuple)):
+            self.root_folders = [self._resolve_path(root) for root in root_folder]
+        else:
+            self.root_folders = [self._resolve_path(root_folder)]
+        self.root_folder = self.root_folders[0]
         self.archive_folder = self._resolve_path(archive_folder)
+        self.root_results = {}
+        self.bundle_lookup = {}
+        self.loaded_indexes = set()
+
+    def set_throttle(self, bytes_per_second=None, ops_per_second=None, windows=None):
+        """Limit mover bandwidth and file operations per second.
+
+        `windows` is a list of ("HH:MM", "HH:MM") pairs during which the limits
+        apply; outside them moves run at full speed. Pass no limits to disable.
+        Limits must be greater than zero.
+        """
+        if bytes_per_second is not None or ops_per_second is not None:
+            self.throttle = IOThrottle(bytes_per_second, ops_per_second, windows)
+        else:
+            self.throttle = None
 
     def _resolve_path(self, path):
         """Resolve UNC paths on Windows and absolute paths on Linux."""
@@ -39,9 +97,41 @@ class EODCleaner:
             return Path(path).resolve()
         return path.absolute()
 
+    def _find_root_runspec_files(self, root):
+        """Find all .runspec.json files in one root folder."""
+        return list(root.rglob("*.runspec.json"))
+
     def find_runspec_files(self):
-        """Find all .runspec.json files in the root folder."""
-        return list(self.root_folder.rglob("*.runspec.json"))
+        """Find all .runspec.json files in the root folders, one thread per root.
+
+        A root that fails is logged and recorded in `root_results` under
+        `runspec_error`; runspec files from the other roots are still returned.
+        """
+        runspec_files = []
+        with ThreadPoolExecutor(max_workers=len(self.root_folders)) as executor:
+            futures = {
+                executor.submit(self._find_root_runspec_files, root): root
+                for root in self.root_folders
+            }
+            for future in as_completed(futures):
+                root = futures[future]
+                result = self.root_results.setdefault(str(root), {})
+                try:
+                    runspecs = future.result()
+                except Exception as e:
+                    logging.error(f"Error finding runspec files in {root}: {e}")
+                    result.update({"runspec_files": 0, "runspec_error": str(e)})
+                    continue
+                result.update({"runspec_files": len(runspecs), "runspec_error": None})
+                runspec_files.extend(runspecs)
+        return runspec_files
+
+    def _root_for(self, path):
+        """Return the root folder containing `path`, or None."""
+        for root in self.root_folders:
+            if Path(path).is_relative_to(root):
+                return root
+        return None
 
     def _resolve_runspec_path(self, input_file, actual_file_path):
         """Resolve EOD paths from the 'inputs' list in the runspec file."""
@@ -86,17 +176,80 @@ class EODCleaner:
             except Exception as e:
                 logging.error(f"Error reading {runspec}: {e}")
 
-    def list_unused_eods(self):
-        """List unused EOD files based on metadata."""
-        unused_eods = []
-        used_count = 0
-        unused_count = 0
-        missing_count = 0
-        # Track found EODs
-        found_eods = set()
+    def _list_directory(self, directory, names):
+        """List a directory once and stat only the entries named in `names`.
+
+        Returns the stat results found and the names that could not be checked.
+        A directory that does not exist means all `names` are missing; any other
+        error (permissions, I/O, unreachable share) leaves them unverified.
+        """
+        found = {}
+        unverified = set()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name not in names:
+                        continue
+                    try:
+                        if entry.is_file():
+                            found[entry.name] = entry.stat()
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        logging.warning(f"Cannot check {entry.path}: {e}")
+                        unverified.add(entry.name)
+        except FileNotFoundError:
+            logging.debug(f"Directory does not exist: {directory}")
+        except OSError as e:
+            logging.warning(f"Cannot list {directory}: {e}")
+            unverified = set(names)
+        return found, unverified
+
+    def verify_eod_paths(self, paths, max_workers=8):
+        """Check existence and size of EOD paths, one directory listing per parent.
+
+        Returns a dict mapping each path to its stat result, or None if missing.
+        Paths that could not be checked are left out. Missing paths are cached
+        for `negative_cache_ttl` seconds.
+        """
+        now = time.monotonic()
+        results = {}
+        by_parent = {}
+        for path in map(Path, paths):
+            if self.negative_cache.get(path, 0) > now:
+                results[path] = None
+                continue
+            by_parent.setdefault(path.parent, set()).add(path.name)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._list_directory, parent, names): parent
+                for parent, names in by_parent.items()
+            }
+            for future in as_completed(futures):
+                parent = futures[future]
+                found, unverified = future.result()
+                for name in by_parent[parent]:
+                    if name in unverified:
+                        continue
+                    path = parent / name
+                    results[path] = found.get(name)
+                    if results[path] is None:
+                        self.negative_cache[path] = now + self.negative_cache_ttl
+                    else:
+                        self.negative_cache.pop(path, None)
 
-        for eod in self.root_folder.rglob("*.eod"):
-            creation_date = eod.stat().st_ctime
+        logging.info(
+            f"Verified {len(results)} runspec paths in {len(by_parent)} directories."
+        )
+        return results
+
+    def _scan_root(self, root):
+        """Walk one root folder and classify its EOD files against runspec_data."""
+        start = time.monotonic()
+        rows = []
+        for eod in root.rglob("*.eod"):
+            stat = eod.stat()
             status = "Unused"
             runspec_file = ""
             input_runspec_path = ""
@@ -104,57 +257,244 @@ class EODCleaner:
                 status = "Used"
                 runspec_file = self.runspec_data[eod.name]["Runspecfile"]
                 input_runspec_path = self.runspec_data[eod.name]["actual_eod_path"]
-                used_count += 1
-                found_eods.add(eod.name)
-            else:
-                unused_count += 1
-            unused_eods.append(
+            rows.append(
                 [
                     str(eod),
                     eod.name,
-                    creation_date,
+                    stat.st_ctime,
                     status,
                     runspec_file,
                     input_runspec_path,
+                    stat.st_size,
                 ]
             )
-            # Check for missing EODs in runspec_data
-        for eod_name, eod_info in self.runspec_data.items():
-            if eod_name not in found_eods:
-                missing_count += 1
-                unused_eods.append(
-                    [
-                        "",
-                        eod_name,
-                        None,
-                        "Missing",
-                        eod_info["Runspecfile"],
-                        eod_info["actual_eod_path"],
-                    ]
+        return rows, time.monotonic() - start
+
+    def list_unused_eods(self):
+        """List unused EOD files based on metadata.
+
+        Each root folder is walked in its own thread against the shared runspec
+        index; per-root rows and throughput are kept in `root_results`. A root
+        that fails to scan is logged and recorded with its error instead of
+        aborting the other roots. `eod_dict` is keyed by full path, so same-named
+        EODs in different folders or roots are all kept.
+        """
+        unused_eods = []
+        used_count = 0
+        unused_count = 0
+        missing_count = 0
+        unverified_count = 0
+        # Track found EODs
+        found_eods = set()
+        self.eod_dict = {}
+
+        with ThreadPoolExecutor(max_workers=len(self.root_folders)) as executor:
+            futures = {
+                executor.submit(self._scan_root, root): root
+                for root in self.root_folders
+            }
+            for future in as_completed(futures):
+                root = futures[future]
+                try:
+                    rows, elapsed = future.result()
+                except Exception as e:
+                    logging.error(f"Error scanning {root}: {e}")
+                    self.root_results.setdefault(str(root), {}).update(
+                        {
+                            "eods": [],
+                            "file_count": 0,
+                            "seconds": 0.0,
+                            "files_per_second": 0.0,
+                            "error": str(e),
+                        }
+                    )
+                    continue
+                rate = len(rows) / elapsed if elapsed > 0 else 0.0
+                self.root_results.setdefault(str(root), {}).update(
+                    {
+                        "eods": rows,
+                        "file_count": len(rows),
+                        "seconds": elapsed,
+                        "files_per_second": rate,
+                        "error": None,
+                    }
+                )
+                logging.info(
+                    f"Scanned {root}: {len(rows)} EOD files in {elapsed:.2f}s "
+                    f"({rate:.1f} files/s)."
                 )
+                for row in rows:
+                    if row[3] == "Used":
+                        used_count += 1
+                        found_eods.add(row[1])
+                    else:
+                        unused_count += 1
+                unused_eods.extend(rows)
+
+        # Check for missing EODs in runspec_data, verifying paths outside the walk
+        not_found = {
+            eod_name: eod_info
+            for eod_name, eod_info in self.runspec_data.items()
+            if eod_name not in found_eods
+        }
+        verified = self.verify_eod_paths(
+            eod_info["actual_eod_path"] for eod_info in not_found.values()
+        )
+        for eod_name, eod_info in not_found.items():
+            actual_path = Path(eod_info["actual_eod_path"])
+            stat = verified.get(actual_path)
+            if actual_path not in verified:
+                # Could not be checked, so neither Used nor Missing
+                unverified_count += 1
+                row = [
+                    "",
+                    eod_name,
+                    None,
+                    "Unverified",
+                    eod_info["Runspecfile"],
+                    eod_info["actual_eod_path"],
+                    None,
+                ]
+            elif stat is not None:
+                used_count += 1
+                row = [
+                    str(actual_path),
+                    eod_name,
+                    stat.st_ctime,
+                    "Used",
+                    eod_info["Runspecfile"],
+                    eod_info["actual_eod_path"],
+                    stat.st_size,
+                ]
+            else:
+                missing_count += 1
+                row = [
+                    "",
+                    eod_name,
+                    None,
+                    "Missing",
+                    eod_info["Runspecfile"],
+                    eod_info["actual_eod_path"],
+                    None,
+                ]
+            unused_eods.append(row)
+            # Attribute runspec-only rows to the root holding the runspec
+            root = self._root_for(eod_info["Runspecfile"])
+            if root is not None:
+                self.root_results[str(root)]["eods"].append(row)
         logging.info(
-            f"Found {len(unused_eods)} EOD files: {used_count} used, {unused_count} unused."
+            f"Found {len(unused_eods)} EOD files: {used_count} used, "
+            f"{unused_count} unused, {missing_count} missing, "
+            f"{unverified_count} unverified."
         )
         for eod in unused_eods:
-            self.eod_dict[eod[1]] = {
+            # Missing EODs have no file path; their runspec path is unique instead
+            key = eod[0] or str(eod[5])
+            root = self._root_for(eod[0] or eod[4])
+            self.eod_dict[key] = {
+                "root": str(root) if root is not None else "",
                 "file_path": eod[0],
                 "file_name": eod[1],
                 "creation_date": eod[2],
                 "status": eod[3],
                 "runspec_file": eod[4],
                 "actual_path_from_runspec": eod[5],
+                "size": eod[6],
             }
         return unused_eods
 
+    def _report_directories(self, directory):
+        """Return `directory` and its parents up to the root folder containing it."""
+        if directory in ("", ".", "N/A", "nan"):
+            return []
+        directory = Path(directory)
+        root = self._root_for(directory)
+        if root is None:
+            return [str(directory)]
+        return [str(directory)] + [
+            str(parent) for parent in directory.parents if parent.is_relative_to(root)
+        ]
+
+    def build_space_report(self, df=None, top_n=20):
+        """Aggregate EOD bytes and counts per status up the directory tree, like du.
+
+        `df` is a scan table with the `eod_dict` columns (such as the one returned by
+        `load_metadata`); defaults to the last scan, one row per file path.
+        Returns the top `top_n` directories by reclaimable (Unused) bytes.
+        """
+        if df is None:
+            df = pd.DataFrame(list(self.eod_dict.values()))
+        if df.empty:
+            return []
+
+        # Missing EODs have no file path; attribute them to their runspec location
+        paths = df["file_path"].where(
+            df["status"] != "Missing", df["actual_path_from_runspec"]
+        )
+        parents = paths.fillna("").astype(str).map(
+            lambda path: str(Path(path).parent) if path else ""
+        )
+        ancestors = {
+            parent: self._report_directories(parent) for parent in parents.unique()
+        }
+        table = pd.DataFrame(
+            {
+                "directory": parents.map(ancestors),
+                "status": df["status"],
+                "size": pd.to_numeric(df["size"], errors="coerce").fillna(0),
+            }
+        )
+        table = table.explode("directory").dropna(subset=["directory"])
+        if table.empty:
+            return []
+
+        grouped = (
+            table.groupby(["directory", "status"])["size"]
+            .agg(["sum", "count"])
+            .unstack(fill_value=0)
+        )
+        statuses = ["Used", "Unused", "Missing"]
+        sizes = grouped["sum"].reindex(columns=statuses, fill_value=0)
+        counts = grouped["count"].reindex(columns=statuses, fill_value=0)
+        report = pd.DataFrame(
+            {
+                "directory": grouped.index,
+                "reclaimable_bytes": sizes["Unused"].astype("int64").values,
+                "used_bytes": sizes["Used"].astype("int64").values,
+                "unused_count": counts["Unused"].values,
+                "used_count": counts["Used"].values,
+                "missing_count": counts["Missing"].values,
+            }
+        )
+        report = report.sort_values(
+            ["reclaimable_bytes", "directory"], ascending=[False, True]
+        ).head(top_n)
+        return report.to_dict("records")
+
+    def save_space_report(self, report, report_file=None):
+        """Save a space report to a JSON file next to the metadata file."""
+        report_file = (
+            Path(report_file)
+            if report_file
+            else self.metadata_file.with_name("eod_space_report.json")
+        )
+        with report_file.open("w") as file:
+            json.dump(report, file, indent=2)
+        logging.info(f"Saved space report to {report_file}")
+        return report_file
+
     def save_metadata(self, metadata):
         """Save metadata to an Excel file."""
         formatted_data = []
 
         for file_name, attributes in metadata.items():
-            formatted_entry = {"File Name": file_name}
+            # Scan entries are keyed by path and carry their own file name
+            formatted_entry = {"File Name": attributes.get("file_name", file_name)}
 
             for key, value in attributes.items():
-                if isinstance(value, (int, float)):  # Convert timestamps
+                if key == "size":
+                    formatted_entry[key] = value if value is not None else "N/A"
+                elif isinstance(value, (int, float)):  # Convert timestamps
                     formatted_entry[key] = datetime.fromtimestamp(value).strftime(
                         "%Y-%m-%d %H:%M:%S"
                     )
@@ -175,29 +515,320 @@ class EODCleaner:
             return pd.read_excel(self.metadata_file)
         return None
 
+    def _hash_file(self, path, offset=0, size=None):
+        """Return the SHA-256 hex digest of a file, or of `size` bytes at `offset`.
+
+        Returns None if the file ends before `size` bytes could be read.
+        """
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            file.seek(offset)
+            remaining = size
+            while remaining != 0:
+                read_size = 1024 * 1024
+                if remaining is not None:
+                    read_size = min(remaining, read_size)
+                chunk = file.read(read_size)
+                if not chunk:
+                    if remaining is not None:
+                        return None
+                    break
+                # Verification reads share the NAS bandwidth limit
+                if self.throttle is not None:
+                    self.throttle.acquire_verify_bytes(len(chunk))
+                digest.update(chunk)
+                if remaining is not None:
+                    remaining -= len(chunk)
+        return digest.hexdigest()
+
+    def _verified_copy(self, src, dst):
+        """Copy a file, hashing it in the same read, and verify the destination.
+
+        The source is read once and the destination is synced to disk. Its size
+        must match the bytes read and the source size; with `verify_readback` it
+        is also re-read and must hash the same. On failure it is removed and
+        OSError is raised, so shutil.move keeps the source. The checksum is
+        recorded in `checksums`.
+        """
+        digest = hashlib.sha256()
+        copied = 0
+        with open(src, "rb") as fsrc, open(dst, "xb") as fdst:
+            while True:
+                chunk = fsrc.read(1024 * 1024)
+                if not chunk:
+                    break
+                if self.throttle is not None:
+                    self.throttle.acquire_bytes(len(chunk))
+                digest.update(chunk)
+                fdst.write(chunk)
+                copied += len(chunk)
+            fdst.flush()
+            os.fsync(fdst.fileno())
+            source_size = os.fstat(fsrc.fileno()).st_size
+        checksum = digest.hexdigest()
+        if copied != source_size or os.stat(dst).st_size != copied:
+            Path(dst).unlink()
+            raise OSError(f"Size mismatch copying {src} to {dst}")
+        if self.verify_readback and self._hash_file(dst) != checksum:
+            Path(dst).unlink()
+            raise OSError(f"Checksum mismatch copying {src} to {dst}")
+        shutil.copystat(src, dst)
+        with self.checksums_lock:
+            self.checksums[str(src)] = {"sha256": checksum, "archive_path": str(dst)}
+        return dst
+
+    def save_checksums(self):
+        """Add checksums of copied and bundled EODs to the metadata file."""
+        df = self.load_metadata()
+        if df is None or not self.checksums:
+            return
+        with self.checksums_lock:
+            checksums = dict(self.checksums)
+        paths = df["file_path"].astype(str)
+        recorded = paths.map(lambda path: checksums.get(path, {}))
+        sha256 = recorded.map(lambda entry: entry.get("sha256"))
+        archive_path = recorded.map(lambda entry: entry.get("archive_path"))
+        # Keep checksums from earlier runs for rows not copied this time
+        if "sha256" in df:
+            sha256 = sha256.fillna(df["sha256"])
+            archive_path = archive_path.fillna(df["archive_path"])
+        df["sha256"] = sha256
+        df["archive_path"] = archive_path
+        df.to_excel(self.metadata_file, index=False)
+        logging.info(f"Saved {len(checksums)} checksums to {self.metadata_file}")
+
     def move_eod(self, eod_path):
-        """Move a single EOD file to the archive."""
+        """Move a single EOD file to the archive, under its full source path.
+
+        An existing archived file is never overwritten.
+        """
         try:
-            shutil.move(str(eod_path), str(self.archive_folder / eod_path.name))
+            target = self.archive_folder / self._archive_name(eod_path)
+            if target.exists():
+                raise FileExistsError(f"{target} is already archived")
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # Renames cost one operation; cross-device moves also pay per byte
+            if self.throttle is not None:
+                self.throttle.acquire_op()
+            shutil.move(str(eod_path), str(target), copy_function=self._verified_copy)
             logging.info(f"Moved {eod_path} to archive.")
         except Exception as e:
             logging.error(f"Error moving {eod_path}: {e}")
 
-    def move_eods(self, use_threading=None):
-        """Move all unused EOD files, with optional threading."""
+    def _archive_name(self, eod_path):
+        """Collision-free archive name for an EOD: its full source path.
+
+        The drive or UNC share is kept as a plain folder name, so EODs with the
+        same path on different drives do not collide either.
+        """
+        eod_path = Path(eod_path)
+        relative = eod_path.relative_to(eod_path.anchor).as_posix()
+        drive = re.sub(r"\W+", "_", eod_path.drive).strip("_")
+        return f"{drive}/{relative}" if drive else relative
+
+    def _close_bundle(self, tar, bundle_path, index):
+        """Close a bundle, verify its members, write the index, then remove sources.
+
+        Each member's tar header in the written bundle must match its indexed
+        offset and size; with `verify_readback` its data is also re-read and must
+        match its SHA-256. Members that fail are left out of the index and their
+        sources are kept. The bundle and index are synced to disk before any
+        source is removed, and member checksums go to `checksums`.
+        """
+        tar.close()
+        with bundle_path.open("rb+") as file:
+            os.fsync(file.fileno())
+        bundle_size = bundle_path.stat().st_size
+        try:
+            with tarfile.open(bundle_path, "r") as written:
+                members = {member.name: member for member in written}
+        except (OSError, tarfile.TarError) as e:
+            logging.error(f"Cannot read back bundle {bundle_path}: {e}")
+            members = {}
+        for eod_path, entry in list(index.items()):
+            member = members.get(entry["member"])
+            verified = (
+                member is not None
+                and member.offset_data == entry["offset"]
+                and member.size == entry["size"]
+                and entry["offset"] + entry["size"] <= bundle_size
+            )
+            if verified and self.verify_readback:
+                checksum = self._hash_file(bundle_path, entry["offset"], entry["size"])
+                verified = checksum == entry["sha256"]
+            if not verified:
+                logging.error(f"Bundled copy of {eod_path} failed verification.")
+                del index[eod_path]
+        index_file = bundle_path.with_name(bundle_path.name + ".index.json")
+        with index_file.open("w") as file:
+            json.dump(index, file, indent=2)
+            file.flush()
+            os.fsync(file.fileno())
+        self._record_index(index_file, index)
+        with self.checksums_lock:
+            for eod_path, entry in index.items():
+                self.checksums[eod_path] = {
+                    "sha256": entry["sha256"],
+                    "archive_path": str(bundle_path),
+                }
+        for eod_path in index:
+            try:
+                Path(eod_path).unlink()
+            except OSError as e:
+                logging.error(f"Error removing bundled {eod_path}: {e}")
+        logging.info(f"Bundled {len(index)} EOD files into {bundle_path}.")
+
+    def bundle_eods(self, file_paths, bundle_size=4 * 1024 * 1024 * 1024):
+        """Stream EOD files into tar bundles in the archive folder.
+
+        A new bundle is started once the current one reaches `bundle_size` bytes.
+        Each bundle gets a `<bundle>.index.json` sidecar mapping the original path
+        to the member's data offset, size and SHA-256, so `restore_eod` can read
+        a single EOD back without unpacking the bundle. Bundle names are unique
+        and created exclusively, so concurrent runs never overwrite each other.
+        Sources are removed only after their member is verified in the bundle.
+        """
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        run_id = f"{os.getpid()}_{uuid.uuid4().hex[:8]}"
+        bundle_number = 0
+        tar = None
+        bundle_path = None
+        index = {}
+
+        for eod_path in map(Path, file_paths):
+            if tar is None or tar.offset >= bundle_size:
+                if tar is not None:
+                    self._close_bundle(tar, bundle_path, index)
+                bundle_number += 1
+                bundle_path = (
+                    self.archive_folder
+                    / f"eod_bundle_{stamp}_{run_id}_{bundle_number:04d}.tar"
+                )
+                tar = tarfile.open(bundle_path, "x")
+                index = {}
+            member_name = self._archive_name(eod_path)
+            start = tar.offset
+            try:
+                tarinfo = tar.gettarinfo(str(eod_path), arcname=member_name)
+                if self.throttle is not None:
+                    self.throttle.acquire_op()
+                    self.throttle.acquire_bytes(tarinfo.size)
+                with eod_path.open("rb") as file:
+                    reader = _HashingReader(file)
+                    tar.addfile(tarinfo, reader)
+            except OSError as e:
+                logging.error(f"Error bundling {eod_path}: {e}")
+                # Drop any partial member so later members keep correct offsets
+                tar.fileobj.seek(start)
+                tar.fileobj.truncate()
+                tar.offset = start
+                continue
+            # Member data is padded to whole blocks and ends at the current offset
+            padded_size = -(-tarinfo.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+            index[str(eod_path)] = {
+                "bundle": bundle_path.name,
+                "member": member_name,
+                "offset": tar.offset - padded_size,
+                "size": tarinfo.size,
+                "sha256": reader.digest.hexdigest(),
+                "bundled_at": time.time_ns(),
+            }
+
+        if tar is not None:
+            self._close_bundle(tar, bundle_path, index)
+
+    def _record_index(self, index_file, index):
+        """Add a bundle index to `bundle_lookup`; the newest entry wins per path.
+
+        Entries are ordered by their `bundled_at` time, falling back to the index
+        file's modification time.
+        """
+        mtime = index_file.stat().st_mtime_ns
+        self.loaded_indexes.add(index_file.name)
+        for eod_path, entry in index.items():
+            bundled_at = entry.get("bundled_at", mtime)
+            current = self.bundle_lookup.get(eod_path)
+            if current is None or current[0] <= bundled_at:
+                self.bundle_lookup[eod_path] = (bundled_at, entry)
+
+    def _refresh_bundle_lookup(self):
+        """Load bundle indexes in the archive folder that are not loaded yet."""
+        index_files = [
+            index_file
+            for index_file in self.archive_folder.glob("*.index.json")
+            if index_file.name not in self.loaded_indexes
+        ]
+        index_files.sort(key=lambda f: (f.stat().st_mtime_ns, f.name))
+        for index_file in index_files:
+            with index_file.open("r") as file:
+                self._record_index(index_file, json.load(file))
+
+    def restore_eod(self, eod_path, destination=None):
+        """Restore one bundled EOD from its bundle offset, verifying its checksum.
+
+        If the EOD was bundled more than once, the newest bundle is used.
+        """
+        eod_path = Path(eod_path)
+        self._refresh_bundle_lookup()
+        if str(eod_path) not in self.bundle_lookup:
+            logging.error(f"No bundle contains {eod_path}.")
+            return None
+        entry = self.bundle_lookup[str(eod_path)][1]
+
+        destination = Path(destination) if destination else eod_path
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        remaining = entry["size"]
+        digest = hashlib.sha256()
+        with (self.archive_folder / entry["bundle"]).open("rb") as src:
+            src.seek(entry["offset"])
+            with destination.open("wb") as dst:
+                while remaining > 0:
+                    chunk = src.read(min(remaining, 1024 * 1024))
+                    if not chunk:
+                        raise EOFError(f"Bundle {entry['bundle']} is truncated")
+                    digest.update(chunk)
+                    dst.write(chunk)
+                    remaining -= len(chunk)
+        if "sha256" in entry and digest.hexdigest() != entry["sha256"]:
+            destination.unlink()
+            raise OSError(f"Checksum mismatch restoring {eod_path}")
+        logging.info(f"Restored {eod_path} from {entry['bundle']}.")
+        return destination
+
+    def move_eods(
+        self, use_threading=None, bundle=False, bundle_threshold=64 * 1024 * 1024
+    ):
+        """Move all unused EOD files, with optional threading.
+
+        With `bundle`, EODs smaller than `bundle_threshold` bytes are packed into
+        tar bundles instead of being moved one file at a time.
+        """
         df = self.load_metadata()
         if df is None:
             logging.error("No metadata found. Run dry scan first.")
             return
 
         self.archive_folder.mkdir(parents=True, exist_ok=True)
+        if self.throttle is not None:
+            self.throttle.reset()
 
         # Collect file paths
         file_paths = [
-            Path(row["File Path"])
+            Path(row["file_path"])
             for _, row in df.iterrows()
-            if row["Status"] == "Unused"
+            if row["status"] == "Unused"
         ]
+
+        if bundle:
+            small_files = [
+                f
+                for f in file_paths
+                if f.exists() and f.stat().st_size < bundle_threshold
+            ]
+            logging.info(f"Bundling {len(small_files)} small files.")
+            self.bundle_eods(small_files)
+            bundled = set(small_files)
+            file_paths = [f for f in file_paths if f not in bundled]
         total_files = len(file_paths)
 
         # Determine execution mode if not explicitly set
@@ -227,3 +858,15 @@ class EODCleaner:
                 if file_path.exists():
                     self.move_eod(file_path)
                     logging.info(f"Moved {i + 1}/{total_files} files.")
+
+        self.save_checksums()
+
+        if self.throttle is not None:
+            report = self.throttle.report()
+            logging.info(
+                f"Throttle: {report['achieved_bytes_per_second']:.0f} B/s "
+                f"(target {report['target_bytes_per_second'] or 'unlimited'}), "
+                f"{report['achieved_ops_per_second']:.1f} ops/s "
+                f"(target {report['target_ops_per_second'] or 'unlimited'}), "
+                f"{report['verify_bytes']} bytes read back for verification."
+            )
@@ -9,6 +9,7 @@ from tkinter.ttk import (
     Label,
     Frame,
     Checkbutton,
+    Notebook,
 )
 from datetime import datetime
 from eod_cleaner.cleaner import EODCleaner
@@ -90,9 +91,17 @@ class EODCleanupGUI:
         )
         self.progress.pack(pady=10, fill=tk.X)
 
+        # Result Tabs
+        notebook = Notebook(main_frame)
+        notebook.pack(pady=10, fill=tk.BOTH, expand=True)
+        eod_tab = Frame(notebook)
+        report_tab = Frame(notebook)
+        notebook.add(eod_tab, text="EOD Files")
+        notebook.add(report_tab, text="Space Report")
+
         # Treeview
         self.tree = Treeview(
-            main_frame,
+            eod_tab,
             columns=(
                 "File Path",
                 "File Name",
@@ -100,20 +109,39 @@ class EODCleanupGUI:
                 "Status",
                 "Runspec File",
                 "Actual Path from runspec",
+                "Size",
             ),
             show="headings",
         )
         for col in self.tree["columns"]:
             self.tree.heading(col, text=col)
             self.tree.column(col, width=200, stretch=tk.YES)
-        self.tree.pack(pady=10, fill=tk.BOTH, expand=True)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+
+        # Space Report
+        self.report_tree = Treeview(
+            report_tab,
+            columns=(
+                "Directory",
+                "Reclaimable Bytes",
+                "Unused",
+                "Used",
+                "Missing",
+            ),
+            show="headings",
+        )
+        for col in self.report_tree["columns"]:
+            self.report_tree.heading(col, text=col)
+            self.report_tree.column(col, width=120, stretch=tk.YES)
+        self.report_tree.column("Directory", width=400)
+        self.report_tree.pack(fill=tk.BOTH, expand=True)
 
         # Filter
         self.filter_var = tk.StringVar(value="All")
         self.filter_menu = Combobox(
             main_frame,
             textvariable=self.filter_var,
-            values=["All", "Used", "Unused", "Missing"],
+            values=["All", "Used", "Unused", "Missing", "Unverified"],
             state="readonly",
         )
         self.filter_menu.pack(pady=5)
@@ -179,7 +207,7 @@ class EODCleanupGUI:
     def select_archive_folder(self):
         folder = filedialog.askdirectory()
         if folder:
-            self.cleaner.set_folders(self.cleaner.root_folder or "", folder)
+            self.cleaner.set_folders(self.cleaner.root_folders or "", folder)
             self.logger.info(f"Archive folder selected: {folder}")
             self.move_btn.config(state=tk.NORMAL)
 
@@ -216,6 +244,7 @@ class EODCleanupGUI:
         self.logger.info("Scan completed and metadata saved.")
         messagebox.showinfo("Success", "Scan completed and metadata saved.")
         self.display_results(unused_eods)
+        self.display_space_report(self.cleaner.build_space_report())
 
     def display_results(self, eods):
         self.all_eods = eods  # Store data for filtering
@@ -223,6 +252,21 @@ class EODCleanupGUI:
         for eod in eods:
             self.tree.insert("", "end", values=eod)
 
+    def display_space_report(self, report):
+        self.report_tree.delete(*self.report_tree.get_children())
+        for entry in report:
+            self.report_tree.insert(
+                "",
+                "end",
+                values=(
+                    entry["directory"],
+                    entry["reclaimable_bytes"],
+                    entry["unused_count"],
+                    entry["used_count"],
+                    entry["missing_count"],
+                ),
+            )
+
     def filter_tree(self, event):
         filter_value = self.filter_var.get()
         self.tree.delete(*self.tree.get_children())  # Clear tree first
@@ -255,9 +299,9 @@ class EODCleanupGUI:
                 return
 
             file_paths = [
-                Path(row["File Path"])
+                Path(row["file_path"])
                 for _, row in df.iterrows()
-                if row["Status"] == "Unused"  # or in ["Unused", "Missing"]
+                if row["status"] == "Unused"  # or in ["Unused", "Missing"]
             ]
             total_files = len(file_paths)
             self.progress["maximum"] = total_files
@@ -269,6 +313,7 @@ class EODCleanupGUI:
                     self.root.update_idletasks()
                     self.logger.info(f"Moved {i + 1}/{total_files} files.")
 
+            self.cleaner.save_checksums()
             self.logger.info("Unused EODs moved.")
             self.progress.stop()
             messagebox.showinfo("Success", "Unused EODs moved.")
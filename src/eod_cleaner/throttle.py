@@ -0,0 +1,132 @@
+import threading
+import time
+from datetime import datetime
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at `rate` tokens per second."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def consume(self, amount):
+        """Take `amount` tokens, sleeping until the bucket is out of debt.
+
+        Requests larger than the capacity are allowed; they leave the bucket in
+        debt, which later callers wait out in turn.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= amount
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+
+class IOThrottle:
+    """Bandwidth and operations-per-second limits shared by all mover threads.
+
+    `windows` is a list of ("HH:MM", "HH:MM") pairs during which the limits
+    apply (a window may wrap past midnight); outside them moves run at full
+    speed. Without windows the limits always apply.
+    """
+
+    def __init__(
+        self, bytes_per_second=None, ops_per_second=None, windows=None, clock=None
+    ):
+        for name, limit in (
+            ("bytes_per_second", bytes_per_second),
+            ("ops_per_second", ops_per_second),
+        ):
+            if limit is not None and limit <= 0:
+                raise ValueError(f"{name} must be greater than zero, got {limit}")
+        self.bytes_per_second = bytes_per_second
+        self.ops_per_second = ops_per_second
+        self.byte_bucket = TokenBucket(bytes_per_second) if bytes_per_second else None
+        self.op_bucket = (
+            TokenBucket(ops_per_second, max(1, ops_per_second))
+            if ops_per_second
+            else None
+        )
+        self.windows = [
+            (self._parse_time(start), self._parse_time(end))
+            for start, end in (windows or [])
+        ]
+        self.clock = clock or datetime.now
+        self.lock = threading.Lock()
+        self.reset()
+
+    def _parse_time(self, value):
+        return datetime.strptime(value, "%H:%M").time()
+
+    def reset(self):
+        """Clear the achieved-rate counters."""
+        with self.lock:
+            self.total_bytes = 0
+            self.total_verify_bytes = 0
+            self.total_ops = 0
+            self.started = time.monotonic()
+
+    def is_active(self):
+        """Return True if the limits apply at the current time of day."""
+        if not self.windows:
+            return True
+        now = self.clock().time()
+        for start, end in self.windows:
+            if start <= end:
+                if start <= now < end:
+                    return True
+            elif now >= start or now < end:
+                return True
+        return False
+
+    def acquire_op(self):
+        """Account for one file operation, waiting if over the ops limit."""
+        with self.lock:
+            self.total_ops += 1
+        if self.op_bucket and self.is_active():
+            self.op_bucket.consume(1)
+
+    def acquire_bytes(self, amount):
+        """Account for `amount` bytes transferred, waiting if over the bandwidth."""
+        with self.lock:
+            self.total_bytes += amount
+        if self.byte_bucket and self.is_active():
+            self.byte_bucket.consume(amount)
+
+    def acquire_verify_bytes(self, amount):
+        """Account for `amount` bytes read back for verification.
+
+        These share the bandwidth limit with moved bytes but are counted
+        separately, so the achieved rate reflects only data moved.
+        """
+        with self.lock:
+            self.total_verify_bytes += amount
+        if self.byte_bucket and self.is_active():
+            self.byte_bucket.consume(amount)
+
+    def report(self):
+        """Return achieved versus target rates since the last reset."""
+        with self.lock:
+            elapsed = time.monotonic() - self.started
+            total_bytes = self.total_bytes
+            total_verify_bytes = self.total_verify_bytes
+            total_ops = self.total_ops
+        return {
+            "seconds": elapsed,
+            "bytes": total_bytes,
+            "verify_bytes": total_verify_bytes,
+            "ops": total_ops,
+            "target_bytes_per_second": self.bytes_per_second,
+            "achieved_bytes_per_second": total_bytes / elapsed if elapsed else 0.0,
+            "target_ops_per_second": self.ops_per_second,
+            "achieved_ops_per_second": total_ops / elapsed if elapsed else 0.0,
+        }
@@ -1,5 +1,8 @@
 import pytest
+import hashlib
+import os
 import shutil
+import tarfile
 import json
 import pandas as pd
 from pathlib import Path
@@ -58,6 +61,217 @@ def test_list_unused_eods(setup_eod_cleaner):
     assert any(eod[1] == "unused.eod" and eod[3] == "Unused" for eod in unused_files)
 
 
+def test_list_unused_eods_verifies_runspec_paths(setup_eod_cleaner, tmp_path):
+    """Test that referenced EODs outside the root are verified, not marked Missing."""
+    cleaner, root_folder, _ = setup_eod_cleaner
+    external = tmp_path / "FLIB"
+    external.mkdir()
+    (external / "external.eod").write_bytes(b"data")
+    runspec_file = root_folder / "test.runspec.json"
+    runspec_file.write_text(
+        json.dumps(
+            [
+                {
+                    "inputs": [
+                        str(external / "external.eod"),
+                        str(external / "gone.eod"),
+                    ]
+                }
+            ]
+        )
+    )
+
+    cleaner.extract_runspec_metadata([runspec_file])
+    eods = {eod[1]: eod for eod in cleaner.list_unused_eods()}
+    assert eods["external.eod"][3] == "Used"
+    assert eods["external.eod"][0] == str(external / "external.eod")
+    assert eods["gone.eod"][3] == "Missing"
+
+
+def test_verify_eod_paths_negative_cache(setup_eod_cleaner):
+    """Test that missing paths are cached until the TTL expires."""
+    cleaner, root_folder, _ = setup_eod_cleaner
+    eod_file = root_folder / "later.eod"
+
+    assert cleaner.verify_eod_paths([eod_file])[eod_file] is None
+    eod_file.write_bytes(b"abc")
+    assert cleaner.verify_eod_paths([eod_file])[eod_file] is None
+
+    cleaner.negative_cache.clear()
+    assert cleaner.verify_eod_paths([eod_file])[eod_file].st_size == 3
+
+
+def test_list_unused_eods_unverified_paths(setup_eod_cleaner, tmp_path, monkeypatch):
+    """Test that unreadable directories are reported Unverified, not Missing."""
+    cleaner, root_folder, _ = setup_eod_cleaner
+    share = tmp_path / "FLIB"
+    share.mkdir()
+    runspec_file = root_folder / "test.runspec.json"
+    runspec_file.write_text(json.dumps([{"inputs": [str(share / "remote.eod")]}]))
+
+    scandir = os.scandir
+
+    def failing_scandir(path):
+        if Path(path) == share:
+            raise PermissionError("denied")
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", failing_scandir)
+    cleaner.extract_runspec_metadata([runspec_file])
+    eods = {eod[1]: eod for eod in cleaner.list_unused_eods()}
+    assert eods["remote.eod"][3] == "Unverified"
+    assert share / "remote.eod" not in cleaner.negative_cache
+
+
+def test_list_unused_eods_multiple_roots(setup_eod_cleaner, tmp_path):
+    """Test scanning several roots against one shared runspec index."""
+    cleaner, root_folder, archive_folder = setup_eod_cleaner
+    second_root = tmp_path / "second"
+    second_root.mkdir()
+    (second_root / "shared.eod").touch()
+    (second_root / "orphan.eod").touch()
+    runspec_file = root_folder / "test.runspec.json"
+    runspec_file.write_text(
+        json.dumps([{"inputs": [str(second_root / "FLIB" / "shared.eod")]}])
+    )
+
+    cleaner.set_folders([root_folder, second_root], archive_folder)
+    cleaner.extract_runspec_metadata(cleaner.find_runspec_files())
+    eods = {eod[1]: eod for eod in cleaner.list_unused_eods()}
+
+    assert eods["shared.eod"][3] == "Used"
+    assert eods["orphan.eod"][3] == "Unused"
+    assert set(cleaner.root_results) == {str(root_folder), str(second_root)}
+    assert cleaner.root_results[str(second_root)]["file_count"] == 2
+    assert cleaner.root_results[str(root_folder)]["file_count"] == 0
+
+
+def test_list_unused_eods_keeps_same_named_files(setup_eod_cleaner, tmp_path):
+    """Test that same-named EODs on different roots are all saved."""
+    cleaner, root_folder, archive_folder = setup_eod_cleaner
+    second_root = tmp_path / "second"
+    (root_folder / "x").mkdir()
+    (second_root / "y").mkdir(parents=True)
+    (root_folder / "x" / "same.eod").touch()
+    (second_root / "y" / "same.eod").touch()
+
+    cleaner.set_folders([root_folder, second_root], archive_folder)
+    cleaner.list_unused_eods()
+    assert set(cleaner.eod_dict) == {
+        str(root_folder / "x" / "same.eod"),
+        str(second_root / "y" / "same.eod"),
+    }
+
+    cleaner.save_metadata(cleaner.eod_dict)
+    df = cleaner.load_metadata()
+    assert list(df["File Name"]) == ["same.eod", "same.eod"]
+    assert set(df["file_path"]) == set(cleaner.eod_dict)
+    assert set(df["root"]) == {str(root_folder), str(second_root)}
+
+
+def test_list_unused_eods_root_failure(setup_eod_cleaner, tmp_path, monkeypatch):
+    """Test that a failing root is recorded without losing the other roots."""
+    cleaner, root_folder, archive_folder = setup_eod_cleaner
+    broken_root = tmp_path / "broken"
+    broken_root.mkdir()
+    (root_folder / "ok.eod").touch()
+    cleaner.set_folders([root_folder, broken_root], archive_folder)
+
+    scan_root = cleaner._scan_root
+
+    def failing_scan_root(root):
+        if root == broken_root:
+            raise PermissionError("denied")
+        return scan_root(root)
+
+    monkeypatch.setattr(cleaner, "_scan_root", failing_scan_root)
+    eods = cleaner.list_unused_eods()
+    assert [eod[1] for eod in eods] == ["ok.eod"]
+    assert cleaner.root_results[str(root_folder)]["error"] is None
+    assert cleaner.root_results[str(broken_root)]["error"] == "denied"
+
+
+def test_find_runspec_files_root_failure(setup_eod_cleaner, tmp_path, monkeypatch):
+    """Test that a root failing runspec discovery does not abort the others."""
+    cleaner, root_folder, archive_folder = setup_eod_cleaner
+    broken_root = tmp_path / "broken"
+    broken_root.mkdir()
+    runspec_file = root_folder / "test.runspec.json"
+    runspec_file.write_text(json.dumps([{"inputs": ["file.eod"]}]))
+    cleaner.set_folders([root_folder, broken_root], archive_folder)
+
+    find_root_runspec_files = cleaner._find_root_runspec_files
+
+    def failing_find(root):
+        if root == broken_root:
+            raise OSError(5, "Input/output error")
+        return find_root_runspec_files(root)
+
+    monkeypatch.setattr(cleaner, "_find_root_runspec_files", failing_find)
+    assert cleaner.find_runspec_files() == [runspec_file]
+    assert cleaner.root_results[str(root_folder)]["runspec_error"] is None
+    assert "Input/output error" in cleaner.root_results[str(broken_root)][
+        "runspec_error"
+    ]
+
+    cleaner.list_unused_eods()
+    assert "Input/output error" in cleaner.root_results[str(broken_root)][
+        "runspec_error"
+    ]
+    assert cleaner.root_results[str(broken_root)]["error"] is None
+
+
+def test_build_space_report(setup_eod_cleaner):
+    """Test aggregating reclaimable bytes up the directory tree."""
+    cleaner, root_folder, _ = setup_eod_cleaner
+    nested = root_folder / "project" / "recordings"
+    nested.mkdir(parents=True)
+    (nested / "big.eod").write_bytes(b"x" * 100)
+    (root_folder / "project" / "small.eod").write_bytes(b"x" * 10)
+    (root_folder / "used.eod").write_bytes(b"x" * 5)
+    runspec_file = root_folder / "test.runspec.json"
+    runspec_file.write_text(json.dumps([{"inputs": ["FLIB/used.eod"]}]))
+
+    cleaner.extract_runspec_metadata([runspec_file])
+    cleaner.list_unused_eods()
+    report = {row["directory"]: row for row in cleaner.build_space_report()}
+
+    assert report[str(root_folder)]["reclaimable_bytes"] == 110
+    assert report[str(root_folder)]["unused_count"] == 2
+    assert report[str(root_folder)]["used_bytes"] == 5
+    assert report[str(root_folder / "project")]["reclaimable_bytes"] == 110
+    assert report[str(nested)]["reclaimable_bytes"] == 100
+    assert cleaner.build_space_report(top_n=1)[0]["directory"] == str(root_folder)
+
+
+def test_build_space_report_same_named_files(setup_eod_cleaner):
+    """Test that same-named EODs in different directories are all counted."""
+    cleaner, root_folder, _ = setup_eod_cleaner
+    (root_folder / "a").mkdir()
+    (root_folder / "b").mkdir()
+    (root_folder / "a" / "same.eod").write_bytes(b"x" * 100)
+    (root_folder / "b" / "same.eod").write_bytes(b"x" * 100)
+
+    cleaner.list_unused_eods()
+    report = {row["directory"]: row for row in cleaner.build_space_report()}
+    assert report[str(root_folder)]["reclaimable_bytes"] == 200
+    assert report[str(root_folder)]["unused_count"] == 2
+    assert report[str(root_folder / "a")]["reclaimable_bytes"] == 100
+    assert report[str(root_folder / "b")]["reclaimable_bytes"] == 100
+
+
+def test_save_space_report(setup_eod_cleaner):
+    """Test writing the space report as JSON."""
+    cleaner, root_folder, _ = setup_eod_cleaner
+    (root_folder / "unused.eod").write_bytes(b"x" * 3)
+    cleaner.list_unused_eods()
+
+    report_file = cleaner.save_space_report(cleaner.build_space_report())
+    report = json.loads(report_file.read_text())
+    assert report[0]["directory"] == str(root_folder)
+    assert report[0]["reclaimable_bytes"] == 3
+
+
 def test_save_metadata(setup_eod_cleaner):
     """Test saving metadata to an Excel file."""
     cleaner, _, _ = setup_eod_cleaner
@@ -76,7 +290,106 @@ def test_move_eod(setup_eod_cleaner):
 
     cleaner.move_eod(eod_file)
     assert not eod_file.exists()
-    assert (archive_folder / "test.eod").exists()
+    assert (archive_folder / cleaner._archive_name(eod_file)).exists()
+
+
+def test_move_eod_same_name(setup_eod_cleaner):
+    """Test that same-named EODs from different folders are both archived."""
+    cleaner, root_folder, archive_folder = setup_eod_cleaner
+    (root_folder / "a").mkdir()
+    (root_folder / "b").mkdir()
+    eod_file1 = root_folder / "a" / "same.eod"
+    eod_file2 = root_folder / "b" / "same.eod"
+    eod_file1.write_bytes(b"first")
+    eod_file2.write_bytes(b"second")
+
+    cleaner.move_eod(eod_file1)
+    cleaner.move_eod(eod_file2)
+    assert not eod_file1.exists()
+    assert not eod_file2.exists()
+    archived1 = archive_folder / cleaner._archive_name(eod_file1)
+    archived2 = archive_folder / cleaner._archive_name(eod_file2)
+    assert archived1.read_bytes() == b"first"
+    assert archived2.read_bytes() == b"second"
+
+    # An EOD with an already-archived path is kept, not overwritten
+    eod_file1.write_bytes(b"again")
+    cleaner.move_eod(eod_file1)
+    assert eod_file1.read_bytes() == b"again"
+    assert archived1.read_bytes() == b"first"
+
+
+def test_move_eod_throttled(setup_eod_cleaner):
+    """Test moving and copying EOD files through the throttle."""
+    cleaner, root_folder, archive_folder = setup_eod_cleaner
+    eod_file = root_folder / "test.eod"
+    eod_file.write_bytes(b"x" * 100)
+    cleaner.set_throttle(bytes_per_second=1024 * 1024, ops_per_second=10)
+
+    cleaner.move_eod(eod_file)
+    archived = archive_folder / cleaner._archive_name(eod_file)
+    assert not eod_file.exists()
+    assert archived.exists()
+    assert cleaner.throttle.report()["ops"] == 1
+
+    cleaner._verified_copy(archived, root_folder / "copy.eod")
+    assert (root_folder / "copy.eod").read_bytes() == b"x" * 100
+    assert cleaner.throttle.report()["bytes"] == 100
+    assert cleaner.throttle.report()["verify_bytes"] == 0
+
+    # Read-back is throttled but counted apart from the bytes moved
+    cleaner.verify_readback = True
+    cleaner._verified_copy(archived, root_folder / "again.eod")
+    assert (root_folder / "again.eod").read_bytes() == b"x" * 100
+    assert cleaner.throttle.report()["bytes"] == 200
+    assert cleaner.throttle.report()["verify_bytes"] == 100
+
+
+def test_verified_copy_records_checksum(setup_eod_cleaner):
+    """Test that copies are hashed, verified and recorded in the metadata file."""
+    cleaner, root_folder, archive_folder = setup_eod_cleaner
+    eod_file = root_folder / "test.eod"
+    eod_file.write_bytes(b"payload")
+    cleaner.list_unused_eods()
+    cleaner.save_metadata(cleaner.eod_dict)
+
+    cleaner._verified_copy(eod_file, archive_folder / "test.eod")
+    expected = hashlib.sha256(b"payload").hexdigest()
+    assert cleaner.checksums[str(eod_file)]["sha256"] == expected
+
+    cleaner.save_checksums()
+    df = cleaner.load_metadata()
+    assert df.iloc[0]["sha256"] == expected
+    assert df.iloc[0]["archive_path"] == str(archive_folder / "test.eod")
+
+
+def test_scan_then_move_eods_bundle(setup_eod_cleaner):
+    """Test a real scan, save, bundled move and reload of the metadata file."""
+    cleaner, root_folder, archive_folder = setup_eod_cleaner
+    small_file = root_folder / "small.eod"
+    large_file = root_folder / "large.eod"
+    used_file = root_folder / "used.eod"
+    small_file.write_bytes(b"small")
+    large_file.write_bytes(b"x" * 2048)
+    used_file.write_bytes(b"used")
+    runspec_file = root_folder / "test.runspec.json"
+    runspec_file.write_text(json.dumps([{"inputs": ["FLIB/used.eod"]}]))
+
+    cleaner.extract_runspec_metadata(cleaner.find_runspec_files())
+    cleaner.list_unused_eods()
+    cleaner.save_metadata(cleaner.eod_dict)
+    cleaner.move_eods(use_threading=False, bundle=True, bundle_threshold=1024)
+
+    assert not small_file.exists()
+    assert not large_file.exists()
+    assert used_file.exists()
+    assert (archive_folder / cleaner._archive_name(large_file)).exists()
+    df = cleaner.load_metadata().set_index("file_path")
+    assert df.loc[str(small_file), "sha256"] == hashlib.sha256(b"small").hexdigest()
+    assert df.loc[str(small_file), "archive_path"] == str(
+        next(archive_folder.glob("*.tar"))
+    )
+    assert pd.isna(df.loc[str(used_file), "sha256"])
 
 
 def test_move_eods(setup_eod_cleaner):
@@ -97,8 +410,152 @@ def test_move_eods(setup_eod_cleaner):
     cleaner.move_eods(use_threading=False)
     assert not eod_file1.exists()
     assert not eod_file2.exists()
-    assert (archive_folder / "file1.eod").exists()
-    assert (archive_folder / "file2.eod").exists()
+    assert (archive_folder / cleaner._archive_name(eod_file1)).exists()
+    assert (archive_folder / cleaner._archive_name(eod_file2)).exists()
+
+
+def test_bundle_eods_and_restore(setup_eod_cleaner):
+    """Test bundling same-named EODs and restoring one from its bundle."""
+    cleaner, root_folder, archive_folder = setup_eod_cleaner
+    (root_folder / "a").mkdir()
+    (root_folder / "b").mkdir()
+    eod_file1 = root_folder / "a" / "same.eod"
+    eod_file2 = root_folder / "b" / "same.eod"
+    eod_file1.write_bytes(b"first" * 200)
+    eod_file2.write_bytes(b"second")
+
+    cleaner.bundle_eods([eod_file1, eod_file2])
+    assert not eod_file1.exists()
+    assert not eod_file2.exists()
+    assert len(list(archive_folder.glob("*.tar"))) == 1
+    index_file = next(archive_folder.glob("*.index.json"))
+    index = json.loads(index_file.read_text())
+    assert set(index) == {str(eod_file1), str(eod_file2)}
+    assert index[str(eod_file2)]["sha256"] == hashlib.sha256(b"second").hexdigest()
+
+    cleaner.restore_eod(eod_file2)
+    assert eod_file2.read_bytes() == b"second"
+    restored = cleaner.restore_eod(eod_file1, root_folder / "restored.eod")
+    assert restored.read_bytes() == b"first" * 200
+
+
+def test_bundle_eods_rolls_over(setup_eod_cleaner):
+    """Test that a new bundle is started once the size limit is reached."""
+    cleaner, root_folder, archive_folder = setup_eod_cleaner
+    eod_files = [root_folder / f"file{i}.eod" for i in range(3)]
+    for eod_file in eod_files:
+        eod_file.write_bytes(b"x" * 1024)
+
+    cleaner.bundle_eods(eod_files, bundle_size=1024)
+    assert len(list(archive_folder.glob("*.tar"))) == 3
+    assert cleaner.restore_eod(eod_files[2]).read_bytes() == b"x" * 1024
+
+
+def test_bundle_eods_member_failure(setup_eod_cleaner, monkeypatch):
+    """Test that a member failing mid-write keeps later members intact."""
+    cleaner, root_folder, archive_folder = setup_eod_cleaner
+    eod_files = [root_folder / f"file{i}.eod" for i in range(3)]
+    for i, eod_file in enumerate(eod_files):
+        eod_file.write_bytes(bytes([i]) * 1000)
+
+    gettarinfo = tarfile.TarFile.gettarinfo
+
+    def inflated_gettarinfo(self, name=None, arcname=None, fileobj=None):
+        tarinfo = gettarinfo(self, name, arcname, fileobj)
+        if name == str(eod_files[1]):
+            tarinfo.size += 600
+        return tarinfo
+
+    monkeypatch.setattr(tarfile.TarFile, "gettarinfo", inflated_gettarinfo)
+    cleaner.bundle_eods(eod_files)
+
+    assert not eod_files[0].exists()
+    assert eod_files[1].exists()
+    assert not eod_files[2].exists()
+    bundle_path = next(archive_folder.glob("*.tar"))
+    with tarfile.open(bundle_path) as tar:
+        assert len(tar.getmembers()) == 2
+    assert cleaner.restore_eod(eod_files[2]).read_bytes() == bytes([2]) * 1000
+
+
+def test_bundle_eods_verifies_before_unlinking(setup_eod_cleaner, monkeypatch):
+    """Test that a member failing read-back verification keeps its source."""
+    cleaner, root_folder, archive_folder = setup_eod_cleaner
+    eod_file = root_folder / "test.eod"
+    eod_file.write_bytes(b"data")
+    cleaner.verify_readback = True
+    monkeypatch.setattr(cleaner, "_hash_file", lambda *args: "bad")
+
+    cleaner.bundle_eods([eod_file])
+    assert eod_file.exists()
+    index_file = next(archive_folder.glob("*.index.json"))
+    assert json.loads(index_file.read_text()) == {}
+
+
+def test_close_bundle_checks_headers(setup_eod_cleaner, monkeypatch):
+    """Test that members are checked against the bundle's tar headers by default."""
+    cleaner, root_folder, archive_folder = setup_eod_cleaner
+    good_file = root_folder / "good.eod"
+    bad_file = root_folder / "bad.eod"
+    good_file.write_bytes(b"good")
+    bad_file.write_bytes(b"bad")
+    monkeypatch.setattr(cleaner, "_hash_file", lambda *args: pytest.fail("read"))
+
+    bundle_path = archive_folder / "test.tar"
+    tar = tarfile.open(bundle_path, "x")
+    index = {}
+    for eod_file in (good_file, bad_file):
+        name = cleaner._archive_name(eod_file)
+        tar.add(str(eod_file), arcname=name)
+        size = eod_file.stat().st_size
+        # Each file's data fits in the single block before the current offset
+        index[str(eod_file)] = {
+            "bundle": bundle_path.name,
+            "member": name,
+            "offset": tar.offset - tarfile.BLOCKSIZE,
+            "size": size,
+            "sha256": hashlib.sha256(eod_file.read_bytes()).hexdigest(),
+        }
+    index[str(bad_file)]["offset"] += tarfile.BLOCKSIZE
+
+    cleaner._close_bundle(tar, bundle_path, index)
+    assert not good_file.exists()
+    assert bad_file.exists()
+    assert set(index) == {str(good_file)}
+
+
+def test_bundle_eods_repeated_runs(setup_eod_cleaner):
+    """Test that back-to-back runs write separate bundles."""
+    cleaner, root_folder, archive_folder = setup_eod_cleaner
+    eod_file1 = root_folder / "file1.eod"
+    eod_file2 = root_folder / "file2.eod"
+    eod_file1.write_bytes(b"first")
+    eod_file2.write_bytes(b"second")
+
+    cleaner.bundle_eods([eod_file1])
+    cleaner.bundle_eods([eod_file2])
+    assert len(list(archive_folder.glob("*.tar"))) == 2
+    assert cleaner.restore_eod(eod_file1).read_bytes() == b"first"
+    assert cleaner.restore_eod(eod_file2).read_bytes() == b"second"
+
+
+def test_restore_eod_uses_newest_bundle(setup_eod_cleaner):
+    """Test that an EOD bundled twice is restored from the newest bundle."""
+    cleaner, root_folder, _ = setup_eod_cleaner
+    eod_file = root_folder / "test.eod"
+    eod_file.write_bytes(b"old")
+    cleaner.bundle_eods([eod_file])
+    cleaner.restore_eod(eod_file)
+    eod_file.write_bytes(b"new")
+    cleaner.bundle_eods([eod_file])
+
+    assert cleaner.restore_eod(eod_file).read_bytes() == b"new"
+
+    # A fresh cleaner loads the indexes from disk and still picks the newest
+    reloaded = EODCleaner(metadata_file=cleaner.metadata_file)
+    reloaded.set_folders(root_folder, cleaner.archive_folder)
+    eod_file.unlink()
+    assert reloaded.restore_eod(eod_file).read_bytes() == b"new"
 
 
 def test_load_metadata(setup_eod_cleaner):
@@ -130,8 +587,8 @@ def test_move_eods_with_threading(setup_eod_cleaner):
     cleaner.move_eods(use_threading=True)
     assert not eod_file1.exists()
     assert not eod_file2.exists()
-    assert (archive_folder / "file1.eod").exists()
-    assert (archive_folder / "file2.eod").exists()
+    assert (archive_folder / cleaner._archive_name(eod_file1)).exists()
+    assert (archive_folder / cleaner._archive_name(eod_file2)).exists()
 
 
 def test_move_missing_eod(setup_eod_cleaner):
@@ -0,0 +1,63 @@
+import pytest
+import time
+from datetime import datetime
+from eod_cleaner.throttle import IOThrottle, TokenBucket
+
+
+def test_token_bucket_waits_when_in_debt():
+    """Test that consuming past the capacity blocks until tokens refill."""
+    bucket = TokenBucket(rate=1000)
+    start = time.monotonic()
+    bucket.consume(1000)
+    assert time.monotonic() - start < 0.1
+    bucket.consume(200)
+    assert time.monotonic() - start >= 0.15
+
+
+def test_io_throttle_windows():
+    """Test that limits apply only inside the time-of-day windows."""
+    day = IOThrottle(
+        bytes_per_second=1,
+        windows=[("08:00", "18:00")],
+        clock=lambda: datetime(2025, 3, 17, 12, 0),
+    )
+    night = IOThrottle(
+        bytes_per_second=1,
+        windows=[("08:00", "18:00")],
+        clock=lambda: datetime(2025, 3, 17, 23, 0),
+    )
+    overnight = IOThrottle(
+        bytes_per_second=1,
+        windows=[("22:00", "06:00")],
+        clock=lambda: datetime(2025, 3, 17, 23, 0),
+    )
+    assert day.is_active()
+    assert not night.is_active()
+    assert overnight.is_active()
+
+    start = time.monotonic()
+    night.acquire_bytes(10 * 1024 * 1024)
+    assert time.monotonic() - start < 0.1
+
+
+def test_io_throttle_rejects_non_positive_limits():
+    """Test that zero or negative limits are rejected."""
+    with pytest.raises(ValueError):
+        IOThrottle(bytes_per_second=0)
+    with pytest.raises(ValueError):
+        IOThrottle(ops_per_second=-1)
+
+
+def test_io_throttle_report():
+    """Test that achieved rates are reported alongside the targets."""
+    throttle = IOThrottle(bytes_per_second=1024 * 1024, ops_per_second=100)
+    throttle.acquire_op()
+    throttle.acquire_bytes(512)
+    throttle.acquire_verify_bytes(256)
+
+    report = throttle.report()
+    assert report["ops"] == 1
+    assert report["bytes"] == 512
+    assert report["verify_bytes"] == 256
+    assert report["target_ops_per_second"] == 100
+    assert report["achieved_bytes_per_second"] > 0